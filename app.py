@@ -10,18 +10,67 @@ Features:
 - Professional application architecture
 """
 
-from flask import Flask, request, render_template, redirect, url_for, flash, jsonify
-from datetime import datetime
+from flask import (Flask, request, render_template, redirect, url_for, flash, jsonify, session,
+                   make_response)
+from flask.json.provider import JSONProvider
+from flask_caching import Cache
+from collections import namedtuple
+from datetime import date, datetime
+from functools import lru_cache, wraps
 import re
 import os
+import sqlite3
+import threading
+import time
+import uuid
 import json
+import math
+import orjson
+
+def json_default(obj):
+    """Serialize types orjson does not handle natively"""
+    if isinstance(obj, Account):
+        return obj.to_dict()
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+def dump_json(obj):
+    """Serialize to JSON bytes with sorted keys"""
+    return orjson.dumps(obj, default=json_default, option=orjson.OPT_SORT_KEYS)
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson for faster API serialization"""
+    
+    def dumps(self, obj, **kwargs):
+        return dump_json(obj).decode()
+    
+    def loads(self, s, **kwargs):
+        # orjson has no object_hook; the session serializer relies on it
+        if kwargs:
+            return json.loads(s, **kwargs)
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dump_json(obj), mimetype='application/json')
 
 # Initialize Flask application
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.secret_key = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
 
-# In-memory database for demo (replace with actual database in production)
-accounts = [
+# Keep compiled templates in a plain dict (the template set is small and
+# fixed); must be set before anything touches app.jinja_env
+app.jinja_options = {**app.jinja_options, 'cache_size': -1}
+
+# Short-lived cache for read-only GET views, cleared whenever accounts change
+VIEW_CACHE_TIMEOUT = 15
+cache = Cache(app, config={
+    'CACHE_TYPE': 'SimpleCache',
+    'CACHE_DEFAULT_TIMEOUT': VIEW_CACHE_TIMEOUT
+})
+
+# Demo accounts loaded into an empty database
+SEED_ACCOUNTS = [
     {
         'id': 1,
         'first_name': 'John',
@@ -57,19 +106,135 @@ accounts = [
     }
 ]
 
-# Global counter for unique IDs
-next_id = max([acc['id'] for acc in accounts]) + 1 if accounts else 1
+# SQLite database; in-memory by default so the demo needs no setup.
+# Set DATABASE_PATH to a file to keep data across restarts.
+DATABASE_PATH = os.environ.get('DATABASE_PATH', ':memory:')
+
+ACCOUNT_FIELDS = ('id', 'first_name', 'last_name', 'email', 'account_type',
+                  'department', 'status', 'created_date', 'balance')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS accounts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    first_name TEXT NOT NULL,
+    last_name TEXT NOT NULL,
+    email TEXT NOT NULL UNIQUE,
+    account_type TEXT NOT NULL,
+    department TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_date TEXT NOT NULL,
+    balance REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_accounts_account_type ON accounts (account_type);
+CREATE INDEX IF NOT EXISTS idx_accounts_status ON accounts (status);
+CREATE INDEX IF NOT EXISTS idx_accounts_created_date ON accounts (created_date);
+"""
+
+ACCOUNT_COLUMNS_SQL = ', '.join(ACCOUNT_FIELDS)
+
+class Account:
+    """Account record; __slots__ keeps rows smaller than per-record dicts"""
+    __slots__ = ACCOUNT_FIELDS
+    
+    def __init__(self, id, first_name, last_name, email, account_type,
+                 department, status, created_date, balance):
+        self.id = id
+        self.first_name = first_name
+        self.last_name = last_name
+        self.email = email
+        self.account_type = account_type
+        self.department = department
+        self.status = status
+        self.created_date = created_date
+        self.balance = balance
+    
+    def to_dict(self):
+        """Return the account fields as a dict for JSON output"""
+        return {field: getattr(self, field) for field in ACCOUNT_FIELDS}
+
+def account_factory(cursor, row):
+    """Build Account objects from rows selected with ACCOUNT_COLUMNS_SQL"""
+    return Account(*row)
+
+def select_accounts(sql, params=()):
+    """Run an account query and return a cursor that yields Account objects"""
+    cursor = db.cursor()
+    cursor.row_factory = account_factory
+    return cursor.execute(f'SELECT {ACCOUNT_COLUMNS_SQL} FROM accounts {sql}', params)
+
+def dict_factory(cursor, row):
+    """Return non-account query rows (counts, aggregates) as plain dicts"""
+    return {column[0]: value for column, value in zip(cursor.description, row)}
+
+def init_db(path):
+    """Open the database, create the schema and seed an empty table"""
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.row_factory = dict_factory
+    if path != ':memory:':
+        conn.execute('PRAGMA journal_mode=WAL')
+    with conn:
+        conn.executescript(SCHEMA)
+        if conn.execute('SELECT COUNT(*) AS n FROM accounts').fetchone()['n'] == 0:
+            conn.executemany(
+                'INSERT INTO accounts (%s) VALUES (%s)' % (
+                    ', '.join(ACCOUNT_FIELDS), ', '.join(':' + f for f in ACCOUNT_FIELDS)),
+                SEED_ACCOUNTS)
+    return conn
+
+db = init_db(DATABASE_PATH)
+
+# Guards the shared connection: writes hold it for their whole transaction
+# and reads take it too, so no thread sees another's uncommitted rows.
+# Reentrant because write paths run validation queries while holding it.
+accounts_lock = threading.RLock()
+
+# Bumped on every create/edit/delete so derived values can be cached
+_accounts_version = 0
+
+# Per-process nonce so ETags from a previous boot never match this one
+BOOT_ID = uuid.uuid4().hex
+
+# (version, stats, stats as dict), replaced as a whole so readers never
+# see parts from different computations
+_stats_cache = {'entry': (-1, None, None)}
+
+# Immutable dashboard statistics, built once per accounts version
+DashboardStats = namedtuple('DashboardStats', 'total_accounts active_accounts '
+                            'inactive_accounts total_balance average_balance')
+
+# Rows fetched and serialized per chunk when streaming /api/accounts
+STREAM_BATCH_SIZE = 500
+
+# Bulk import limits: records per request, and emails per IN (...) lookup
+# (kept under SQLite's default bound-parameter limit)
+MAX_BULK_ACCOUNTS = 1000
+EMAIL_LOOKUP_BATCH_SIZE = 500
+
+# Health check timestamp, reformatted at most once per second
+_timestamp_cache = {'second': None, 'value': None}
+
+# Allowed values for constrained account fields
+VALID_ACCOUNT_TYPES = frozenset({'basic', 'standard', 'premium'})
+VALID_STATUSES = frozenset({'active', 'inactive'})
+
+# Precompiled email pattern (\Z rejects a trailing newline, unlike $)
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\Z')
 
 # Utility Functions
+@lru_cache(maxsize=2048)
 def validate_email(email):
-    """Validate email format"""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    """Validate email format (memoized; resubmitted forms repeat inputs)"""
+    return _EMAIL_RE.match(email) is not None
 
 def validate_balance(balance_str):
     """Validate and convert balance to float"""
+    # Accept form strings and JSON numbers only (bool is an int subclass)
+    if isinstance(balance_str, bool) or not isinstance(balance_str, (str, int, float)):
+        return None, "Invalid balance format"
     try:
         balance = float(balance_str)
+        if not math.isfinite(balance):
+            return None, "Invalid balance format"
         if balance < 0:
             return None, "Balance cannot be negative"
         if balance > 1000000:
@@ -78,24 +243,215 @@ def validate_balance(balance_str):
     except (ValueError, TypeError):
         return None, "Invalid balance format"
 
+def get_text(data, key):
+    """Read a string field from form or JSON data, treating other types as empty"""
+    value = data.get(key, '')
+    return value if isinstance(value, str) else ''
+
+def validate_account_data(data, account_id=None, require_status=False,
+                          check_email_in_use=True):
+    """Validate submitted account fields, returning (fields, errors)
+    
+    Every problem is reported at once; the email format and uniqueness
+    checks are skipped only when no email was given. Pass
+    check_email_in_use=False to skip the database lookup (bulk import
+    checks uniqueness for the whole batch separately).
+    """
+    fields = {
+        'first_name': get_text(data, 'first_name').strip(),
+        'last_name': get_text(data, 'last_name').strip(),
+        'email': get_text(data, 'email').strip().lower(),
+        'account_type': get_text(data, 'account_type'),
+        'department': get_text(data, 'department').strip()
+    }
+    if require_status:
+        fields['status'] = get_text(data, 'status')
+    
+    errors = []
+    
+    if not fields['first_name']:
+        errors.append("First name is required")
+    if not fields['last_name']:
+        errors.append("Last name is required")
+    if not fields['email']:
+        errors.append("Email is required")
+    elif not validate_email(fields['email']):
+        errors.append("Invalid email format")
+    elif (check_email_in_use and
+          find_account_id_by_email(fields['email']) not in (None, account_id)):
+        errors.append("Email already exists")
+    
+    if fields['account_type'] not in VALID_ACCOUNT_TYPES:
+        errors.append("Valid account type is required")
+    if not fields['department']:
+        errors.append("Department is required")
+    if require_status and fields['status'] not in VALID_STATUSES:
+        errors.append("Valid status is required")
+    
+    balance, balance_error = validate_balance(data.get('balance', '0'))
+    if balance_error:
+        errors.append(balance_error)
+    
+    fields['balance'] = balance
+    return fields, errors
+
 def find_account(account_id):
     """Find account by ID"""
-    return next((acc for acc in accounts if acc['id'] == account_id), None)
+    with accounts_lock:
+        return select_accounts('WHERE id = ?', (account_id,)).fetchone()
 
-def calculate_dashboard_stats():
-    """Calculate dashboard statistics"""
-    total_accounts = len(accounts)
-    active_accounts = len([acc for acc in accounts if acc['status'] == 'active'])
-    total_balance = sum(acc['balance'] for acc in accounts)
+def find_account_id_by_email(email):
+    """Return the ID of the account using an email, or None"""
+    with accounts_lock:
+        row = db.execute('SELECT id FROM accounts WHERE email = ?', (email,)).fetchone()
+    return row['id'] if row else None
+
+def find_existing_emails(emails):
+    """Return the subset of emails already used by stored accounts"""
+    emails = list(emails)
+    existing = set()
+    with accounts_lock:
+        for start in range(0, len(emails), EMAIL_LOOKUP_BATCH_SIZE):
+            chunk = emails[start:start + EMAIL_LOOKUP_BATCH_SIZE]
+            placeholders = ', '.join('?' * len(chunk))
+            rows = db.execute(f'SELECT email FROM accounts WHERE email IN ({placeholders})',
+                              chunk).fetchall()
+            existing.update(row['email'] for row in rows)
+    return existing
+
+def count_accounts():
+    """Return the number of stored accounts"""
+    with accounts_lock:
+        return db.execute('SELECT COUNT(*) AS n FROM accounts').fetchone()['n']
+
+def query_accounts(account_type=None, status=None):
+    """List accounts in creation order, optionally filtered by type and status"""
+    conditions = []
+    params = []
+    if account_type:
+        conditions.append('account_type = ?')
+        params.append(account_type)
+    if status:
+        conditions.append('status = ?')
+        params.append(status)
+    
+    sql = 'ORDER BY id'
+    if conditions:
+        sql = 'WHERE ' + ' AND '.join(conditions) + ' ' + sql
+    with accounts_lock:
+        return select_accounts(sql, params).fetchall()
+
+def recent_accounts(limit=5):
+    """Most recently created accounts, newest first"""
+    with accounts_lock:
+        return select_accounts('ORDER BY created_date DESC, id LIMIT ?', (limit,)).fetchall()
+
+INSERT_ACCOUNT_SQL = 'INSERT INTO accounts (%s) VALUES (%s)' % (
+    ', '.join(ACCOUNT_FIELDS[1:]), ', '.join(':' + f for f in ACCOUNT_FIELDS[1:]))
+
+def add_account(account):
+    """Insert a new account and return its ID"""
+    with db:
+        cursor = db.execute(INSERT_ACCOUNT_SQL, account)
+    return cursor.lastrowid
+
+def add_accounts(new_accounts):
+    """Insert several new accounts in a single transaction"""
+    with db:
+        db.executemany(INSERT_ACCOUNT_SQL, new_accounts)
+
+def update_account(account_id, fields):
+    """Apply field changes to an account; returns False if it no longer exists"""
+    assignments = ', '.join(f'{name} = ?' for name in fields)
+    with db:
+        cursor = db.execute(f'UPDATE accounts SET {assignments} WHERE id = ?',
+                            (*fields.values(), account_id))
+    return cursor.rowcount > 0
+
+def remove_account(account_id):
+    """Delete an account"""
+    with db:
+        db.execute('DELETE FROM accounts WHERE id = ?', (account_id,))
+
+def current_timestamp():
+    """ISO timestamp at one-second resolution, cached within each second"""
+    second = int(time.time())
+    if _timestamp_cache['second'] != second:
+        _timestamp_cache['value'] = datetime.fromtimestamp(second).isoformat()
+        _timestamp_cache['second'] = second
+    return _timestamp_cache['value']
+
+def mark_accounts_changed():
+    """Invalidate cached values derived from the accounts list"""
+    global _accounts_version
+    _accounts_version += 1
+    cache.clear()
+
+def has_pending_flashes():
+    """Check whether the session holds flash messages not yet shown"""
+    return '_flashes' in session
+
+def is_cacheable_response(rv):
+    """Only cache plain 200 responses that did not flash a message"""
+    if isinstance(rv, tuple) or has_pending_flashes():
+        return False
+    return getattr(rv, 'status_code', 200) == 200
+
+def _dashboard_stats_entry():
+    """Return the cached (version, stats, dict) entry, recomputing if stale"""
+    # Read the version once: if a write lands while querying, the result is
+    # tagged with the older version and recomputed on the next call
+    version = _accounts_version
+    entry = _stats_cache['entry']
+    if entry[0] == version:
+        return entry
+    
+    with accounts_lock:
+        row = db.execute(
+            "SELECT COUNT(*) AS total, "
+            "COALESCE(SUM(status = 'active'), 0) AS active, "
+            "COALESCE(SUM(balance), 0) AS balance "
+            "FROM accounts").fetchone()
+    total_accounts = row['total']
+    active_accounts = row['active']
+    total_balance = round(row['balance'], 2)
     avg_balance = total_balance / total_accounts if total_accounts > 0 else 0
     
-    return {
-        'total_accounts': total_accounts,
-        'active_accounts': active_accounts,
-        'inactive_accounts': total_accounts - active_accounts,
-        'total_balance': total_balance,
-        'average_balance': avg_balance
-    }
+    stats = DashboardStats(
+        total_accounts=total_accounts,
+        active_accounts=active_accounts,
+        inactive_accounts=total_accounts - active_accounts,
+        total_balance=total_balance,
+        average_balance=avg_balance
+    )
+    entry = (version, stats, stats._asdict())
+    _stats_cache['entry'] = entry
+    return entry
+
+def calculate_dashboard_stats():
+    """Calculate dashboard statistics (cached until accounts change)"""
+    return _dashboard_stats_entry()[1]
+
+def accounts_etag(version):
+    """ETag value for a given accounts version in this process"""
+    return f'{BOOT_ID}-{version}'
+
+def etag_on_accounts_version(view):
+    """Tag responses with the accounts version and answer repeat polls with 304"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        etag = accounts_etag(_accounts_version)
+        if request.if_none_match.contains_weak(etag):
+            response = make_response('', 304)
+            response.set_etag(etag, weak=True)
+            return response
+        
+        response = make_response(view(*args, **kwargs))
+        # Views that know which version their body came from tag it themselves
+        if response.get_etag()[0] is None:
+            response.set_etag(etag, weak=True)
+        return response
+    return wrapper
 
 # Error Handlers
 @app.errorhandler(404)
@@ -114,27 +470,22 @@ def internal_error(error):
 
 # Routes
 @app.route('/')
+@cache.cached(timeout=VIEW_CACHE_TIMEOUT, query_string=True,
+              unless=has_pending_flashes, response_filter=is_cacheable_response)
 def dashboard():
     """Main dashboard with account overview"""
     stats = calculate_dashboard_stats()
-    recent_accounts = sorted(accounts, key=lambda x: x['created_date'], reverse=True)[:5]
-    return render_template('dashboard.html', stats=stats, recent_accounts=recent_accounts)
+    return render_template('dashboard.html', stats=stats, recent_accounts=recent_accounts())
 
 @app.route('/accounts')
+@cache.cached(timeout=VIEW_CACHE_TIMEOUT, query_string=True,
+              unless=has_pending_flashes, response_filter=is_cacheable_response)
 def list_accounts():
     """Display all accounts"""
     account_type_filter = request.args.get('type', '')
     status_filter = request.args.get('status', '')
     
-    filtered_accounts = accounts
-    
-    if account_type_filter:
-        filtered_accounts = [acc for acc in filtered_accounts 
-                           if acc['account_type'] == account_type_filter]
-    
-    if status_filter:
-        filtered_accounts = [acc for acc in filtered_accounts 
-                           if acc['status'] == status_filter]
+    filtered_accounts = query_accounts(account_type_filter, status_filter)
     
     return render_template('accounts.html', 
                          accounts=filtered_accounts,
@@ -142,6 +493,8 @@ def list_accounts():
                          status_filter=status_filter)
 
 @app.route('/account/<int:account_id>')
+@cache.cached(timeout=VIEW_CACHE_TIMEOUT, query_string=True,
+              unless=has_pending_flashes, response_filter=is_cacheable_response)
 def view_account(account_id):
     """View single account details"""
     account = find_account(account_id)
@@ -154,40 +507,24 @@ def view_account(account_id):
 @app.route('/account/create', methods=['GET', 'POST'])
 def create_account():
     """Create new account"""
-    global next_id
-    
     if request.method == 'POST':
-        # Get form data
-        first_name = request.form.get('first_name', '').strip()
-        last_name = request.form.get('last_name', '').strip()
-        email = request.form.get('email', '').strip().lower()
-        account_type = request.form.get('account_type', '')
-        department = request.form.get('department', '').strip()
-        balance_str = request.form.get('balance', '0')
-        
-        # Validation
-        errors = []
-        
-        if not first_name:
-            errors.append("First name is required")
-        if not last_name:
-            errors.append("Last name is required")
-        if not email:
-            errors.append("Email is required")
-        elif not validate_email(email):
-            errors.append("Invalid email format")
-        elif any(acc['email'] == email for acc in accounts):
-            errors.append("Email already exists")
-        
-        if not account_type or account_type not in ['basic', 'standard', 'premium']:
-            errors.append("Valid account type is required")
-        
-        if not department:
-            errors.append("Department is required")
-        
-        balance, balance_error = validate_balance(balance_str)
-        if balance_error:
-            errors.append(balance_error)
+        # Validate and insert under the lock so concurrent requests cannot
+        # claim the same email
+        with accounts_lock:
+            fields, errors = validate_account_data(request.form)
+            
+            if not errors:
+                new_account_id = add_account({
+                    'first_name': fields['first_name'],
+                    'last_name': fields['last_name'],
+                    'email': fields['email'],
+                    'account_type': fields['account_type'],
+                    'department': fields['department'],
+                    'status': 'active',
+                    'created_date': date.today().isoformat(),
+                    'balance': fields['balance']
+                })
+                mark_accounts_changed()
         
         if errors:
             for error in errors:
@@ -196,24 +533,8 @@ def create_account():
                                  form_data=request.form,
                                  form_type='create')
         
-        # Create account
-        new_account = {
-            'id': next_id,
-            'first_name': first_name,
-            'last_name': last_name,
-            'email': email,
-            'account_type': account_type,
-            'department': department,
-            'status': 'active',
-            'created_date': datetime.now().strftime('%Y-%m-%d'),
-            'balance': balance
-        }
-        
-        accounts.append(new_account)
-        next_id += 1
-        
-        flash(f'Account created successfully for {first_name} {last_name}!', 'success')
-        return redirect(url_for('view_account', account_id=new_account['id']))
+        flash(f"Account created successfully for {fields['first_name']} {fields['last_name']}!", 'success')
+        return redirect(url_for('view_account', account_id=new_account_id))
     
     return render_template('account_form.html', form_type='create')
 
@@ -226,41 +547,15 @@ def edit_account(account_id):
         return redirect(url_for('list_accounts'))
     
     if request.method == 'POST':
-        # Get form data
-        first_name = request.form.get('first_name', '').strip()
-        last_name = request.form.get('last_name', '').strip()
-        email = request.form.get('email', '').strip().lower()
-        account_type = request.form.get('account_type', '')
-        department = request.form.get('department', '').strip()
-        status = request.form.get('status', '')
-        balance_str = request.form.get('balance', '0')
-        
-        # Validation
-        errors = []
-        
-        if not first_name:
-            errors.append("First name is required")
-        if not last_name:
-            errors.append("Last name is required")
-        if not email:
-            errors.append("Email is required")
-        elif not validate_email(email):
-            errors.append("Invalid email format")
-        elif any(acc['email'] == email and acc['id'] != account_id for acc in accounts):
-            errors.append("Email already exists")
-        
-        if not account_type or account_type not in ['basic', 'standard', 'premium']:
-            errors.append("Valid account type is required")
-        
-        if not department:
-            errors.append("Department is required")
-        
-        if not status or status not in ['active', 'inactive']:
-            errors.append("Valid status is required")
-        
-        balance, balance_error = validate_balance(balance_str)
-        if balance_error:
-            errors.append(balance_error)
+        updated = False
+        with accounts_lock:
+            fields, errors = validate_account_data(request.form, account_id=account_id,
+                                                   require_status=True)
+            
+            if not errors:
+                updated = update_account(account_id, fields)
+                if updated:
+                    mark_accounts_changed()
         
         if errors:
             for error in errors:
@@ -270,18 +565,12 @@ def edit_account(account_id):
                                  form_data=request.form,
                                  form_type='edit')
         
-        # Update account
-        account.update({
-            'first_name': first_name,
-            'last_name': last_name,
-            'email': email,
-            'account_type': account_type,
-            'department': department,
-            'status': status,
-            'balance': balance
-        })
+        # Another request may have deleted the account since it was loaded
+        if not updated:
+            flash('Account not found', 'error')
+            return redirect(url_for('list_accounts'))
         
-        flash(f'Account updated successfully for {first_name} {last_name}!', 'success')
+        flash(f"Account updated successfully for {fields['first_name']} {fields['last_name']}!", 'success')
         return redirect(url_for('view_account', account_id=account_id))
     
     return render_template('account_form.html', account=account, form_type='edit')
@@ -289,28 +578,100 @@ def edit_account(account_id):
 @app.route('/account/<int:account_id>/delete', methods=['POST'])
 def delete_account(account_id):
     """Delete account"""
-    account = find_account(account_id)
+    with accounts_lock:
+        account = find_account(account_id)
+        if account:
+            remove_account(account_id)
+            mark_accounts_changed()
+    
     if not account:
         flash('Account not found', 'error')
         return redirect(url_for('list_accounts'))
     
-    account_name = f"{account['first_name']} {account['last_name']}"
-    accounts.remove(account)
+    account_name = f"{account.first_name} {account.last_name}"
     
     flash(f'Account for {account_name} has been deleted successfully', 'success')
     return redirect(url_for('list_accounts'))
 
 # API Routes (RESTful endpoints)
 @app.route('/api/accounts')
+@etag_on_accounts_version
 def api_list_accounts():
-    """API endpoint to list all accounts"""
+    """API endpoint to list all accounts, streamed in batches"""
+    def generate():
+        # Keys are emitted in sorted order to match the other JSON responses;
+        # count comes after the accounts so it can be tallied while streaming.
+        # The lock is taken per batch, not held while the client reads.
+        with accounts_lock:
+            cursor = select_accounts('ORDER BY id')
+        count = 0
+        yield b'{"accounts":['
+        while True:
+            with accounts_lock:
+                rows = cursor.fetchmany(STREAM_BATCH_SIZE)
+            if not rows:
+                break
+            chunk = b','.join(dump_json(account) for account in rows)
+            yield (b',' if count else b'') + chunk
+            count += len(rows)
+        yield b'],"count":%d,"success":true}' % count
+    
+    return app.response_class(generate(), mimetype='application/json')
+
+@app.route('/api/accounts/bulk', methods=['POST'])
+def api_bulk_create_accounts():
+    """API endpoint to create many accounts from a JSON array"""
+    records = request.get_json(force=True, silent=True)
+    if not isinstance(records, list):
+        return jsonify({'success': False, 'message': 'Expected a JSON array of accounts'}), 400
+    if len(records) > MAX_BULK_ACCOUNTS:
+        return jsonify({
+            'success': False,
+            'message': f'At most {MAX_BULK_ACCOUNTS} accounts per request'
+        }), 413
+    
+    created_date = date.today().isoformat()
+    new_accounts = []
+    errors = []
+    
+    # Checks that don't touch the database run before taking the lock
+    candidates = []
+    for index, record in enumerate(records):
+        if not isinstance(record, dict):
+            errors.append({'index': index, 'errors': ["Account must be a JSON object"]})
+            continue
+        fields, record_errors = validate_account_data(record, check_email_in_use=False)
+        candidates.append((index, fields, record_errors))
+    
+    checked_emails = {fields['email'] for _, fields, _ in candidates
+                      if fields['email'] and validate_email(fields['email'])}
+    
+    with accounts_lock:
+        taken_emails = find_existing_emails(checked_emails)
+        for index, fields, record_errors in candidates:
+            if fields['email'] in checked_emails and fields['email'] in taken_emails:
+                record_errors.append("Email already exists")
+            if record_errors:
+                errors.append({'index': index, 'errors': record_errors})
+                continue
+            
+            taken_emails.add(fields['email'])
+            new_accounts.append({**fields, 'status': 'active', 'created_date': created_date})
+        
+        if new_accounts:
+            add_accounts(new_accounts)
+            mark_accounts_changed()
+    
+    errors.sort(key=lambda error: error['index'])
     return jsonify({
-        'success': True,
-        'count': len(accounts),
-        'accounts': accounts
+        'success': not errors,
+        'created': len(new_accounts),
+        'errors': errors
     })
 
 @app.route('/api/account/<int:account_id>')
+@cache.cached(timeout=VIEW_CACHE_TIMEOUT, query_string=True,
+              unless=has_pending_flashes, response_filter=is_cacheable_response)
 def api_get_account(account_id):
     """API endpoint to get single account"""
     account = find_account(account_id)
@@ -320,27 +681,35 @@ def api_get_account(account_id):
     return jsonify({'success': True, 'account': account})
 
 @app.route('/api/stats')
+@etag_on_accounts_version
 def api_stats():
     """API endpoint for dashboard statistics"""
-    return jsonify({
+    # Not view-cached: the stats dict is already cached per version, and the
+    # ETag must name the version the body was computed for
+    version, _, stats = _dashboard_stats_entry()
+    response = jsonify({
         'success': True,
-        'stats': calculate_dashboard_stats()
+        'stats': stats
     })
+    response.set_etag(accounts_etag(version), weak=True)
+    return response
 
 @app.route('/health')
 def health_check():
     """Health check endpoint"""
     return jsonify({
         'status': 'healthy',
-        'timestamp': datetime.now().isoformat(),
-        'accounts_count': len(accounts)
+        'timestamp': current_timestamp(),
+        'accounts_count': count_accounts()
     })
 
 if __name__ == '__main__':
     # Railway provides PORT environment variable
     port = int(os.environ.get('PORT', 8080))
-    print("🚀 Starting AccountPro")
+    print("🚀 Starting AccountPro (development server)")
     print(f"📍 Running on port {port}")
+    print("🏭 For production, serve with gunicorn (see Procfile):")
+    print(f"   gunicorn -w 1 -k gthread --threads 8 -b 0.0.0.0:{port} app:app")
     
     # Railway requires specific host/port binding
     app.run(